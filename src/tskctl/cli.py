@@ -9,34 +9,75 @@ This module:
 - keeps user interaction (prompts, selection) here.
 
 KISS rule: keep commands small and predictable.
+
+Engine modules are imported inside the command functions, so `--help`
+and argument errors do not pay for loading YAML and the engine.
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
+import os
 import shutil
 import subprocess
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
-from tskctl.engine.actions import set_next_action, set_status, touch_task
-from tskctl.engine.model import Status, Task
-from tskctl.engine.ops import NewTaskRequest, create_task
-from tskctl.engine.parse import ParseError, parse_task
-from tskctl.engine.render import attach_tasks, build_project_tree, render_task_detail, render_tree
-from tskctl.engine.scan import iter_projects, iter_task_files
-from tskctl.engine.validate import ValidationError, validate_task_file
+if TYPE_CHECKING:
+    from tskctl.engine.model import Task
+    from tskctl.engine.scan import TaskFile
+    from tskctl.engine.validate import ValidationResult
 
 
 # ---------------------------------------------------------------------
 # Parser
 # ---------------------------------------------------------------------
 
-def _build_parser() -> argparse.ArgumentParser:
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """
+    Build the argument parser.
+
+    If `command` names a known subcommand, only that subparser is added
+    (enough to parse its arguments); otherwise all subcommands are added.
+    """
     parser = argparse.ArgumentParser(prog="tskctl")
     sub = parser.add_subparsers(dest="command", required=True)
 
-    # ------------------------------------------------------------------
-    # Read-only commands
-    # ------------------------------------------------------------------
+    # Fixed usage (set after add_subparsers, which derives subcommand progs
+    # from it) so errors list every command even when only one is built.
+    parser.usage = "%(prog)s [-h] {" + ",".join(_SUBCOMMANDS) + "} ..."
+
+    builder = _SUBCOMMANDS.get(command or "")
+    if builder is not None:
+        builder(sub)
+        return parser
+
+    for builder in _SUBCOMMANDS.values():
+        builder(sub)
+
+    return parser
+
+
+def _non_negative_int(raw: str) -> int:
+    """
+    argparse type for counts where 0 means "default".
+    """
+    try:
+        value = int(raw)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{raw}'") from e
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {value}")
+    return value
 
+
+# ---------------------------------------------------------------------
+# Parser: read-only commands
+# ---------------------------------------------------------------------
+
+def _add_validate(sub: argparse._SubParsersAction) -> None:
     p_validate = sub.add_parser(
         "validate",
         help="Validate task files in the subtree",
@@ -60,8 +101,22 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Check existence of linked files (project-root-relative)",
     )
+    p_validate.add_argument(
+        "-j",
+        "--jobs",
+        type=_non_negative_int,
+        default=0,
+        help="Parallel workers (default: CPU count; 1 = serial)",
+    )
+    p_validate.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first invalid task",
+    )
     p_validate.set_defaults(func=cmd_validate)
 
+
+def _add_list(sub: argparse._SubParsersAction) -> None:
     p_list = sub.add_parser(
         "list",
         help="List tasks as a project tree",
@@ -82,6 +137,8 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     p_list.set_defaults(func=cmd_list)
 
+
+def _add_here(sub: argparse._SubParsersAction) -> None:
     p_here = sub.add_parser(
         "here",
         help="List tasks only for the current directory",
@@ -95,6 +152,8 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     p_here.set_defaults(func=cmd_here)
 
+
+def _add_show(sub: argparse._SubParsersAction) -> None:
     p_show = sub.add_parser(
         "show",
         help="Show a single task (structured view)",
@@ -119,10 +178,12 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     p_show.set_defaults(func=cmd_show)
 
-    # ------------------------------------------------------------------
-    # Create command
-    # ------------------------------------------------------------------
 
+# ---------------------------------------------------------------------
+# Parser: create command
+# ---------------------------------------------------------------------
+
+def _add_new(sub: argparse._SubParsersAction) -> None:
     p_new = sub.add_parser(
         "new",
         help="Create a new task in the current project",
@@ -165,10 +226,12 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     p_new.set_defaults(func=cmd_new)
 
-    # ------------------------------------------------------------------
-    # Write commands
-    # ------------------------------------------------------------------
 
+# ---------------------------------------------------------------------
+# Parser: write commands
+# ---------------------------------------------------------------------
+
+def _add_status(sub: argparse._SubParsersAction) -> None:
     p_status = sub.add_parser(
         "status",
         help="Change task status",
@@ -204,6 +267,8 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     p_status.set_defaults(func=cmd_status)
 
+
+def _add_done(sub: argparse._SubParsersAction) -> None:
     p_done = sub.add_parser(
         "done",
         help="Mark task as done",
@@ -228,6 +293,8 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     p_done.set_defaults(func=cmd_done)
 
+
+def _add_next(sub: argparse._SubParsersAction) -> None:
     p_next = sub.add_parser(
         "next",
         help="Set next action for task",
@@ -258,6 +325,8 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     p_next.set_defaults(func=cmd_next)
 
+
+def _add_touch(sub: argparse._SubParsersAction) -> None:
     p_touch = sub.add_parser(
         "touch",
         help="Touch task without changing its state",
@@ -282,53 +351,134 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     p_touch.set_defaults(func=cmd_touch)
 
-    return parser
+
+_SUBCOMMANDS: dict[str, Callable[[argparse._SubParsersAction], None]] = {
+    "validate": _add_validate,
+    "list": _add_list,
+    "here": _add_here,
+    "show": _add_show,
+    "new": _add_new,
+    "status": _add_status,
+    "done": _add_done,
+    "next": _add_next,
+    "touch": _add_touch,
+}
 
 
 # ---------------------------------------------------------------------
 # Commands
 # ---------------------------------------------------------------------
 
+def _work_dir(args: argparse.Namespace) -> Path:
+    """
+    Return the absolute working directory for -C/--cd.
+
+    Purely lexical (no symlink resolution); build_project_tree and link
+    checks canonicalise paths themselves where it matters.
+    """
+    return Path(os.path.abspath(args.cd or "."))
+
+
 def cmd_validate(args: argparse.Namespace) -> int:
-    base = Path.cwd()
-    root = (base / (args.cd or ".")).resolve()
+    from concurrent.futures import ThreadPoolExecutor
+
+    from tskctl.engine.parse import ParseError, parse_task
+    from tskctl.engine.scan import iter_projects, iter_task_files
+    from tskctl.engine.validate import validate_task_file
+
+    root = _work_dir(args)
     level = args.level
     check_links = bool(args.check_links)
+    fail_fast = bool(args.fail_fast)
+    jobs = args.jobs or os.cpu_count() or 1
 
-    had_errors = False
-
+    work: list[tuple[Path, TaskFile]] = []
     for project in iter_projects(root, level=level):
         project_root = Path(project.root_dir)
-
         for tf in iter_task_files(project):
-            try:
-                task = parse_task(tf.task_dir, expected_task_id=tf.task_id)
-            except ParseError as e:
-                had_errors = True
-                print(str(e))
-                continue
+            work.append((project_root, tf))
+
+    # Engine imports happen above, once, before any worker thread starts.
+    def run(item: tuple[Path, TaskFile]) -> list[str]:
+        return _validate_one(
+            item[0],
+            item[1],
+            check_links=check_links,
+            parse=parse_task,
+            validate=validate_task_file,
+            parse_error=ParseError,
+        )
 
-            res = validate_task_file(
-                task,
-                tf.task_dir,
-                expected_task_id=tf.task_id,
-                check_links=check_links,
-                project_root=project_root,
-            )
+    # Parsing and link checks are I/O-bound; results keep scan order.
+    ex = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 and len(work) > 1 else None
+    results = ex.map(run, work) if ex is not None else map(run, work)
 
-            if not res.ok:
-                had_errors = True
-                print(f"{res.path}")
-                for issue in res.issues:
-                    print(f"  - {issue.code}: {issue.message}")
+    had_errors = False
+    try:
+        for lines in results:
+            if not lines:
+                continue
+            had_errors = True
+            sys.stdout.write("\n".join(lines) + "\n")
+            if fail_fast:
+                break
+    finally:
+        if ex is not None:
+            ex.shutdown(cancel_futures=True)
 
     return 1 if had_errors else 0
 
 
+def _validate_one(
+    project_root: Path,
+    tf: TaskFile,
+    *,
+    check_links: bool,
+    parse: Callable[..., Task],
+    validate: Callable[..., ValidationResult],
+    parse_error: type[Exception],
+) -> list[str]:
+    """
+    Parse and validate a single task file.
+
+    Engine callables are passed in by cmd_validate, so worker threads never
+    run module imports. Returns report lines (empty if the task is valid).
+    """
+    try:
+        task = parse(tf.task_dir, expected_task_id=tf.task_id)
+    except parse_error as e:
+        return [str(e)]
+
+    res = validate(
+        task,
+        tf.task_dir,
+        expected_task_id=tf.task_id,
+        check_links=check_links,
+        project_root=project_root,
+    )
+
+    if res.ok:
+        return []
+
+    lines = [f"{res.path}"]
+    for issue in res.issues:
+        lines.append(f"  - {issue.code}: {issue.message}")
+    return lines
+
+
 def cmd_list(args: argparse.Namespace) -> int:
-    base = Path.cwd()
-    root = (base / (args.cd or ".")).resolve()
-    level = args.level
+    root = _work_dir(args)
+    return _list_tree(root, level=args.level)
+
+
+def cmd_here(args: argparse.Namespace) -> int:
+    root = _work_dir(args)
+    return _list_tree(root, level=0)
+
+
+def _list_tree(root: Path, *, level: int) -> int:
+    from tskctl.engine.render import attach_tasks, build_project_tree, render_tree
+    from tskctl.engine.scan import iter_projects
 
     projects = list(iter_projects(root, level=level))
     if not projects:
@@ -341,27 +491,26 @@ def cmd_list(args: argparse.Namespace) -> int:
     return 0
 
 
-def cmd_here(args: argparse.Namespace) -> int:
-    import copy
-
-    a = copy.copy(args)
-    a.level = 0
-    return cmd_list(a)
-
-
 def cmd_new(args: argparse.Namespace) -> int:
+    from tskctl.engine.model import Status
+    from tskctl.engine.ops import NewTaskRequest, create_task
+
     title = (args.title or "").strip()
     interactive = not bool(args.non_interactive)
 
-    base = Path.cwd()
-    cwd = (base / (args.cd or ".")).resolve()
+    # Resolved on first prompt: --non-interactive runs never touch stdin
+    # (it may be closed, e.g. under cron).
+    def ask(prompt: str) -> str:
+        return _prompt_func()(prompt)
+
+    cwd = _work_dir(args)
 
     if not title:
         if not interactive:
             print("Error: --title is required in --non-interactive mode")
             return 1
 
-        title = input("Title: ").strip()
+        title = ask("Title: ").strip()
         if not title:
             print("Error: title is required")
             return 1
@@ -378,19 +527,19 @@ def cmd_new(args: argparse.Namespace) -> int:
             print("Error: --next-action is required unless status=done")
             return 1
 
-        next_action = input("Next action: ").strip()
+        next_action = ask("Next action: ").strip()
         if not next_action:
             print("Error: next action is required unless status=done")
             return 1
 
     summary = (args.summary or "").strip()
     if interactive and not summary:
-        summary = input("Summary (optional): ").strip()
+        summary = ask("Summary (optional): ").strip()
 
     links = tuple(args.link or [])
     if interactive:
         while True:
-            s = input("Link (optional, blank to finish): ").strip()
+            s = ask("Link (optional, blank to finish): ").strip()
             if not s:
                 break
             links = links + (s,)
@@ -414,8 +563,10 @@ def cmd_new(args: argparse.Namespace) -> int:
 
 
 def cmd_show(args: argparse.Namespace) -> int:
-    base = Path.cwd()
-    cwd = (base / (args.cd or ".")).resolve()
+    from tskctl.engine.render import render_task_detail
+    from tskctl.engine.validate import ValidationError
+
+    cwd = _work_dir(args)
 
     try:
         task_dir, task = _choose_task(cwd, (args.task_id or "").strip() or None)
@@ -429,16 +580,36 @@ def cmd_show(args: argparse.Namespace) -> int:
 
 
 def cmd_status(args: argparse.Namespace) -> int:
-    cwd = (Path.cwd() / args.cd).resolve()
+    return _apply_status(
+        args,
+        status=args.status,
+        next_action=args.next_action,
+    )
+
+
+def cmd_done(args: argparse.Namespace) -> int:
+    return _apply_status(args, status="done", next_action=None)
+
+
+def _apply_status(
+    args: argparse.Namespace,
+    *,
+    status: str,
+    next_action: str | None,
+) -> int:
+    from tskctl.engine.actions import set_status
+    from tskctl.engine.validate import ValidationError
+
+    cwd = _work_dir(args)
     task_dir, task = _choose_task(cwd, (args.task_id or "").strip() or None)
 
     try:
         set_status(
             task,
             task_dir,
-            status=args.status,
+            status=status,
             message=args.message,
-            next_action=args.next_action,
+            next_action=next_action,
         )
     except ValidationError as e:
         print(e)
@@ -447,17 +618,11 @@ def cmd_status(args: argparse.Namespace) -> int:
     return 0
 
 
-def cmd_done(args: argparse.Namespace) -> int:
-    import copy
-
-    a = copy.copy(args)
-    a.status = "done"
-    a.next_action = None
-    return cmd_status(a)
-
-
 def cmd_next(args: argparse.Namespace) -> int:
-    cwd = (Path.cwd() / args.cd).resolve()
+    from tskctl.engine.actions import set_next_action
+    from tskctl.engine.validate import ValidationError
+
+    cwd = _work_dir(args)
     task_dir, task = _choose_task(cwd, (args.task_id or "").strip() or None)
 
     try:
@@ -475,7 +640,10 @@ def cmd_next(args: argparse.Namespace) -> int:
 
 
 def cmd_touch(args: argparse.Namespace) -> int:
-    cwd = (Path.cwd() / args.cd).resolve()
+    from tskctl.engine.actions import touch_task
+    from tskctl.engine.validate import ValidationError
+
+    cwd = _work_dir(args)
     task_dir, task = _choose_task(cwd, (args.task_id or "").strip() or None)
 
     try:
@@ -487,10 +655,41 @@ def cmd_touch(args: argparse.Namespace) -> int:
     return 0
 
 
+# ---------------------------------------------------------------------
+# Prompt helpers
+# ---------------------------------------------------------------------
+
+def _prompt_func() -> Callable[[str], str]:
+    """
+    Return a prompt function for interactive input.
+
+    On a TTY this is `input`. When stdin is piped, lines are read from the
+    shared stdin buffer without echoing prompts; EOF reads as a blank line.
+    A closed stdin (None) behaves like immediate EOF.
+    """
+    stdin = sys.stdin
+    if stdin is not None and stdin.isatty():
+        return input
+
+    def read_line(_prompt: str) -> str:
+        return stdin.readline() if stdin is not None else ""
+
+    return read_line
+
+
 # ---------------------------------------------------------------------
 # Task selection helpers
 # ---------------------------------------------------------------------
 
+_FZF_ARGS: tuple[str, ...] = ("--with-nth=2..", "--delimiter=\t")
+
+
+@functools.lru_cache(maxsize=1)
+def _fzf_path() -> str | None:
+    """Return the fzf executable path (PATH is scanned once per process)."""
+    return shutil.which("fzf")
+
+
 def _select_task_id(items: list[tuple[str, str]]) -> str:
     """
     items: list of (task_id, label)
@@ -502,17 +701,36 @@ def _select_task_id(items: list[tuple[str, str]]) -> str:
     if len(items) == 1:
         return items[0][0]
 
-    if shutil.which("fzf"):
-        text = "\n".join([f"{tid}\t{label}" for tid, label in items]) + "\n"
-        p = subprocess.run(
-            ["fzf", "--with-nth=2..", "--delimiter=\t"],
-            input=text,
+    fzf = _fzf_path()
+    if fzf:
+        p = subprocess.Popen(
+            [fzf, *_FZF_ARGS],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            capture_output=True,
         )
-        if p.returncode != 0:
+        assert p.stdin is not None and p.stdout is not None
+
+        # Feed lines as they are produced; fzf starts ranking immediately.
+        # fzf may exit early (selection made or cancelled); closing also
+        # flushes, so it must swallow the broken pipe too.
+        try:
+            for tid, label in items:
+                p.stdin.write(f"{tid}\t{label}\n")
+        except BrokenPipeError:
+            pass
+        finally:
+            try:
+                p.stdin.close()
+            except BrokenPipeError:
+                pass
+
+        out = p.stdout.read()
+        p.stdout.close()
+        if p.wait() != 0:
             return ""
-        line = (p.stdout or "").strip()
+        line = (out or "").strip()
         if not line:
             return ""
         return line.split("\t", 1)[0].strip()
@@ -536,8 +754,13 @@ def _select_task_id(items: list[tuple[str, str]]) -> str:
 
 
 def _resolve_task_dir(cwd: Path, task_id: str) -> Path:
-    task_dir = cwd / ".tasks" / task_id
+    from tskctl.engine.validate import ValidationError
+
+    tasks_dir = cwd / ".tasks"
+    task_dir = tasks_dir / task_id
     if not task_dir.is_dir():
+        if not tasks_dir.is_dir():
+            raise ValidationError(f"No .tasks found in: {cwd}")
         raise ValidationError(f"Task not found: {task_id}")
     return task_dir
 
@@ -548,33 +771,40 @@ def _choose_task(cwd: Path, task_id: str | None) -> tuple[Path, Task]:
 
     Rules:
     - If task_id is provided: resolve directly, then parse (strict).
+      No directory index is built; only the task directory itself is checked.
     - If task_id is not provided: build an index of valid tasks and let the user choose.
     - Invalid tasks are ignored for interactive selection.
     """
-    tasks_dir = cwd / ".tasks"
-    if not tasks_dir.is_dir():
-        raise ValidationError(f"No .tasks found in: {cwd}")
+    from tskctl.engine.parse import parse_task
+    from tskctl.engine.validate import ValidationError
 
     if task_id:
         task_dir = _resolve_task_dir(cwd, task_id)
         task = parse_task(task_dir, expected_task_id=task_id)
         return task_dir, task
 
+    tasks_dir = cwd / ".tasks"
+    if not tasks_dir.is_dir():
+        raise ValidationError(f"No .tasks found in: {cwd}")
+
     items: list[tuple[str, str]] = []
     parsed: dict[str, Task] = {}
+    dirs: dict[str, Path] = {}
 
-    for p in tasks_dir.iterdir():
-        if not p.is_dir():
-            continue
+    with os.scandir(tasks_dir) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
 
-        tid = p.name
-        try:
-            task = parse_task(p, expected_task_id=tid)
-        except Exception:
-            continue
+            tid = entry.name
+            try:
+                task = parse_task(entry.path, expected_task_id=tid, dir_entry=entry)
+            except Exception:
+                continue
 
-        parsed[tid] = task
-        items.append((tid, f"{task.title} ({task.status.value})"))
+            parsed[tid] = task
+            dirs[tid] = Path(entry.path)
+            items.append((tid, f"{task.title} ({task.status.value})"))
 
     if not items:
         raise ValidationError("No tasks found")
@@ -585,7 +815,7 @@ def _choose_task(cwd: Path, task_id: str | None) -> tuple[Path, Task]:
     if not chosen:
         raise ValidationError("Cancelled")
 
-    return _resolve_task_dir(cwd, chosen), parsed[chosen]
+    return dirs[chosen], parsed[chosen]
 
 
 # ---------------------------------------------------------------------
@@ -593,7 +823,10 @@ def _choose_task(cwd: Path, task_id: str | None) -> tuple[Path, Task]:
 # ---------------------------------------------------------------------
 
 def main(argv: list[str] | None = None) -> int:
-    parser = _build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = _build_parser(argv[0] if argv else None)
     args = parser.parse_args(argv)
 
     func = getattr(args, "func", None)
@@ -12,6 +12,10 @@ Design principles:
 - Validation errors are raised early and explicitly.
 """
 
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date
 from pathlib import Path
 from typing import Optional
@@ -25,6 +29,13 @@ from .validate import ValidationError
 # Internal helpers
 # ---------------------------------------------------------------------
 
+# Task dirs (absolute paths) inside an active batched_writes() block;
+# actions on those tasks skip their own write.
+_defer_write: ContextVar[frozenset[str]] = ContextVar(
+    "_defer_write", default=frozenset()
+)
+
+
 def _today() -> date:
     """Return today's date (isolated for testability)."""
     return date.today()
@@ -60,10 +71,21 @@ def _append_log(task: Task, entry: str) -> None:
     task.last_touch = today
 
 
+def _is_repeat(task: Task, entry: str) -> bool:
+    """
+    Return True if `entry` is already the last log line for today.
+    """
+    if not task.log_lines:
+        return False
+    return task.log_lines[-1] == f"{_today().isoformat()}: {entry}"
+
+
 def _write(task: Task, task_dir: Path) -> None:
     """
-    Persist task state to disk.
+    Persist task state to disk (deferred inside batched_writes() for that task).
     """
+    if os.path.abspath(task_dir) in _defer_write.get():
+        return
     write_task(task_dir, task)
 
 
@@ -81,6 +103,24 @@ def _parse_status(raw: str) -> Status:
 # Public actions
 # ---------------------------------------------------------------------
 
+@contextmanager
+def batched_writes(task: Task, task_dir: Path) -> Iterator[None]:
+    """
+    Coalesce several actions on one task into a single write.
+
+    Actions inside the block only update the in-memory task. The task is
+    written once when the block exits normally; nothing is written if
+    the block raises. Actions on other tasks still write immediately.
+    """
+    token = _defer_write.set(_defer_write.get() | {os.path.abspath(task_dir)})
+    try:
+        yield
+    finally:
+        _defer_write.reset(token)
+
+    _write(task, task_dir)
+
+
 def set_status(
     task: Task,
     task_dir: Path,
@@ -94,20 +134,27 @@ def set_status(
 
     - Message is always required.
     - next_action is required unless status is 'done'.
+    - Re-applying the same status, next action and message on the same
+      day is a no-op (no log entry, no write).
     """
     msg = _require_non_empty(message, "Message")
 
     if status != Status.DONE.value:
-        task.next_action = _require_non_empty(next_action, "Next action")
+        na = _require_non_empty(next_action, "Next action")
+        entry = f"[status] {status} - {msg}"
     else:
-        task.next_action = ""
+        na = ""
+        entry = f"[done] {msg}"
 
-    task.status = _parse_status(status)
+    new_status = _parse_status(status)
 
-    if status != Status.DONE.value:
-        _append_log(task, f"[status] {status} - {msg}")
-    else:
-        _append_log(task, f"[done] {msg}")
+    if task.status is new_status and task.next_action == na and _is_repeat(task, entry):
+        return
+
+    task.next_action = na
+    task.status = new_status
+
+    _append_log(task, entry)
     _write(task, task_dir)
 
 
@@ -121,17 +168,22 @@ def set_next_action(
     """
     Update next_action for an active task.
 
-    Forbidden for done tasks.
+    Forbidden for done tasks. Re-applying the same next action and message
+    on the same day is a no-op.
     """
     if task.status is Status.DONE:
         raise ValidationError("Cannot set next action on done task")
 
     msg = _require_non_empty(message, "Message")
     na = _require_non_empty(next_action, "Next action")
+    entry = f"[next] {na} - {msg}"
+
+    if task.next_action == na and _is_repeat(task, entry):
+        return
 
     task.next_action = na
 
-    _append_log(task, f"[next] {na} - {msg}")
+    _append_log(task, entry)
     _write(task, task_dir)
 
 
@@ -42,13 +42,15 @@ class Status(str, Enum):
 
         Lower value = higher priority.
         """
-        order = {
-            cls.ACTIVE: 0,
-            cls.WAITING: 1,
-            cls.PAUSED: 2,
-            cls.DONE: 3,
-        }
-        return order[status]
+        return _STATUS_ORDER[status]
+
+
+_STATUS_ORDER: dict[Status, int] = {
+    Status.ACTIVE: 0,
+    Status.WAITING: 1,
+    Status.PAUSED: 2,
+    Status.DONE: 3,
+}
 
 
 # ---------------------------------------------------------------------
@@ -115,21 +117,21 @@ class Task:
         YAML syntax, section presence, and IO-related checks belong
         to parse/validate layers, not here.
         """
-        if not self.task_id or not self.task_id.strip():
+        if not self.task_id or self.task_id.isspace():
             raise ValueError("task_id must be a non-empty string")
 
-        if not self.title or not self.title.strip():
+        if not self.title or self.title.isspace():
             raise ValueError("title must be a non-empty string")
 
         if self.created > self.last_touch:
             raise ValueError("created must be <= last_touch")
 
-        na = self.next_action.strip()
+        has_action = bool(self.next_action) and not self.next_action.isspace()
         if self.status is Status.DONE:
-            if na:
+            if has_action:
                 raise ValueError("next_action must be empty when status is 'done'")
         else:
-            if not na:
+            if not has_action:
                 raise ValueError("next_action must be non-empty unless status is 'done'")
 
     # -----------------------------------------------------------------
@@ -142,7 +144,8 @@ class Task:
 
     @property
     def status_rank(self) -> int:
-        return Status.sort_key(self.status)
+        # Derived, not stored: actions mutate `status` in place.
+        return _STATUS_ORDER[self.status]
 
 
 # ---------------------------------------------------------------------
@@ -178,11 +181,11 @@ def sort_tasks(tasks: Iterable[Task]) -> list[Task]:
     2. last_touch (older first)
     3. task_id (stable tie-breaker)
     """
-    return sorted(
-        tasks,
-        key=lambda t: (
-            t.status_rank,
-            t.last_touch,
-            t.task_id,
-        ),
-    )
+    order = _STATUS_ORDER
+    # Input position keeps the sort stable and Task objects out of comparisons.
+    decorated = [
+        (order[t.status], t.last_touch, t.task_id, i, t)
+        for i, t in enumerate(tasks)
+    ]
+    decorated.sort()
+    return [d[-1] for d in decorated]
@@ -14,11 +14,12 @@ No parsing is performed here.
 
 from __future__ import annotations
 
+import os
 import re
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, Final, Iterable
 
 import yaml
 
@@ -29,6 +30,10 @@ if TYPE_CHECKING:
     from .model import Task
 
 
+# libyaml-backed dumper when available (see parse._YAML_LOADER).
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
 # ---------------------------------------------------------------------
 # Public request objects
 # ---------------------------------------------------------------------
@@ -50,7 +55,9 @@ class NewTaskRequest:
 # Slugging / ids
 # ---------------------------------------------------------------------
 
-_SLUG_RE = re.compile(r"[^a-z0-9_]+")
+# Any run of characters outside [a-z0-9] (whitespace and "_" included)
+# collapses to a single "_".
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
 
 
 def slugify(title: str) -> str:
@@ -59,43 +66,38 @@ def slugify(title: str) -> str:
 
     The slug is intended to be stable and predictable.
     """
-    s = title.strip().lower()
-    s = re.sub(r"\s+", "_", s)
-    s = _SLUG_RE.sub("_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
+    s = _SLUG_RE.sub("_", title.lower()).strip("_")
     return s or "task"
 
 
 def next_task_seq(tasks_dir: Path, created: date) -> int:
     """
     Compute the next sequence number for the given creation date.
+
+    The directory listing is the source of truth: entries are filtered by
+    the date prefix only. Any entry with a `<date>__NNN` name (directory,
+    symlink or stray file) blocks that number, since the name is taken.
     """
     prefix = created.isoformat() + "__"
     best = 0
 
-    if not tasks_dir.is_dir():
+    try:
+        with os.scandir(tasks_dir) as it:
+            for entry in it:
+                name = entry.name
+                if not name.startswith(prefix):
+                    continue
+
+                try:
+                    n = int(name[len(prefix):].split("__", 1)[0])
+                except ValueError:
+                    continue
+
+                if n > best:
+                    best = n
+    except (FileNotFoundError, NotADirectoryError):
         return 1
 
-    for p in tasks_dir.iterdir():
-        if not p.is_dir():
-            continue
-
-        name = p.name
-        if not name.startswith(prefix):
-            continue
-
-        parts = name.split("__", 2)
-        if len(parts) < 2:
-            continue
-
-        try:
-            n = int(parts[1])
-        except ValueError:
-            continue
-
-        if n > best:
-            best = n
-
     return best + 1
 
 
@@ -213,7 +215,7 @@ def write_task(task_dir: Path, task: "Task") -> None:
             created_s=task.created.isoformat(),
             last_touch_s=task.last_touch.isoformat(),
             next_action=task.next_action,
-            links=[Link(kind=ln.kind, value=ln.value) for ln in task.links],
+            links=task.links,
             format_version=2,
         ),
         encoding="utf-8",
@@ -229,8 +231,7 @@ def write_task(task_dir: Path, task: "Task") -> None:
     if summary:
         summary_path.write_text(summary + "\n", encoding="utf-8")
     else:
-        if summary_path.exists():
-            summary_path.unlink()
+        summary_path.unlink(missing_ok=True)
 
 
 def _render_task_yml(
@@ -241,7 +242,7 @@ def _render_task_yml(
     created_s: str,
     last_touch_s: str,
     next_action: str,
-    links: list[Link],
+    links: Iterable[Link],
     format_version: int,
 ) -> str:
     data = {
@@ -254,7 +255,7 @@ def _render_task_yml(
         "format": int(format_version),
         "links": [{"kind": ln.kind, "value": ln.value} for ln in links],
     }
-    return yaml.safe_dump(data, sort_keys=False, allow_unicode=True)
+    return yaml.dump(data, Dumper=_YAML_DUMPER, sort_keys=False, allow_unicode=True)
 
 
 def _normalise_links(raw_links: tuple[str, ...]) -> list[Link]:
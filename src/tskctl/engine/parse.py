@@ -14,7 +14,7 @@ This module performs *structural* parsing only and returns a Task model.
 Model-level invariants are enforced via Task.validate().
 """
 
-from dataclasses import dataclass
+import os
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Final, Optional
@@ -35,19 +35,26 @@ SUMMARY_MD_NAME: Final[str] = "summary.md"
 REQUIRED_FILES: Final[tuple[str, ...]] = (TASK_YML_NAME, TASK_LOG_NAME)
 OPTIONAL_FILES: Final[tuple[str, ...]] = (SUMMARY_MD_NAME,)
 
+# Prefer the libyaml-backed loader; fall back to pure Python if PyYAML
+# was built without it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 # ---------------------------------------------------------------------
 # Exceptions
 # ---------------------------------------------------------------------
 
-@dataclass(frozen=True, slots=True)
 class ParseError(Exception):
     """
     Raised when task directory contents are syntactically or structurally invalid.
     """
 
-    path: str
-    message: str
+    __slots__ = ("path", "message")
+
+    def __init__(self, path: str, message: str) -> None:
+        super().__init__(path, message)
+        self.path = path
+        self.message = message
 
     def __str__(self) -> str:
         return f"{self.path}: {self.message}"
@@ -57,7 +64,12 @@ class ParseError(Exception):
 # Public API
 # ---------------------------------------------------------------------
 
-def parse_task(task_dir: str | Path, expected_task_id: Optional[str] = None) -> Task:
+def parse_task(
+    task_dir: str | Path,
+    expected_task_id: Optional[str] = None,
+    *,
+    dir_entry: Optional[os.DirEntry[str]] = None,
+) -> Task:
     """
     Parse a task directory into a Task model.
 
@@ -68,34 +80,42 @@ def parse_task(task_dir: str | Path, expected_task_id: Optional[str] = None) ->
 
     expected_task_id:
         If provided, task.yml 'id' must match this value (usually directory name).
+
+    dir_entry:
+        Optional scandir entry for `task_dir`. Callers that already listed the
+        parent directory pass it to skip the directory existence checks.
     """
     d = Path(task_dir)
 
-    if not d.exists():
-        raise ParseError(str(d), "Task directory does not exist")
-    if not d.is_dir():
-        raise ParseError(str(d), "Task path is not a directory")
+    if dir_entry is None or not dir_entry.is_dir():
+        if not d.exists():
+            raise ParseError(str(d), "Task directory does not exist")
+        if not d.is_dir():
+            raise ParseError(str(d), "Task path is not a directory")
 
     _require_files(d)
 
-    meta = _parse_task_yml(d / TASK_YML_NAME)
+    yml_path = d / TASK_YML_NAME
+    yml = str(yml_path)
+
+    meta = _parse_task_yml(yml_path)
     log_lines = _parse_task_log(d / TASK_LOG_NAME)
     summary = _read_optional_text(d / SUMMARY_MD_NAME)
 
-    task_id = _require_str_field(str(d / TASK_YML_NAME), meta, "id")
+    task_id = _require_str_field(yml, meta, "id")
     if expected_task_id is not None and task_id != expected_task_id:
         raise ParseError(
-            str(d / TASK_YML_NAME),
+            yml,
             f"YAML id '{task_id}' does not match expected id '{expected_task_id}'",
         )
 
-    title = _require_str_field(str(d / TASK_YML_NAME), meta, "title")
-    status = _parse_status(str(d / TASK_YML_NAME), meta)
-    created = _parse_date(str(d / TASK_YML_NAME), meta, "created")
-    last_touch = _parse_date(str(d / TASK_YML_NAME), meta, "last_touch")
-    next_action = _require_str_field(str(d / TASK_YML_NAME), meta, "next_action", allow_empty=True)
+    title = _require_str_field(yml, meta, "title")
+    status = _parse_status(yml, meta)
+    created = _parse_date(yml, meta, "created")
+    last_touch = _parse_date(yml, meta, "last_touch")
+    next_action = _require_str_field(yml, meta, "next_action", allow_empty=True)
 
-    links = _parse_links(str(d / TASK_YML_NAME), meta)
+    links = _parse_links(yml, meta)
 
     format_version = _optional_int_field(meta, "format", default=2)
 
@@ -137,12 +157,14 @@ def _require_files(task_dir: Path) -> None:
 
 def _parse_task_yml(path: Path) -> dict[str, Any]:
     try:
-        text = path.read_text(encoding="utf-8")
+        raw = path.read_bytes()
     except OSError as e:
         raise ParseError(str(path), f"Cannot read file: {e}") from e
 
+    # Bytes go straight to the loader (libyaml decodes them itself); invalid
+    # UTF-8 surfaces as a YAML error.
     try:
-        data = yaml.safe_load(text) or {}
+        data = yaml.load(raw, Loader=_YAML_LOADER) or {}
     except Exception as e:
         raise ParseError(str(path), f"Invalid YAML: {e}") from e
 
@@ -251,17 +273,11 @@ def _parse_links(path: str, data: dict[str, Any]) -> list[Link]:
 
 def _parse_task_log(path: Path) -> list[str]:
     try:
-        text = path.read_text(encoding="utf-8")
+        with open(path, encoding="utf-8") as f:
+            lines = [raw.rstrip() for raw in f if not raw.isspace()]
     except OSError as e:
         raise ParseError(str(path), f"Cannot read file: {e}") from e
 
-    lines: list[str] = []
-    for raw in text.splitlines():
-        s = raw.strip()
-        if not s:
-            continue
-        lines.append(raw.rstrip())
-
     if not lines:
         raise ParseError(str(path), "Log file is empty (at least one entry is required)")
 
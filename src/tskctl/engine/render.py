@@ -13,17 +13,22 @@ should not mutate task state or write files.
 
 from __future__ import annotations
 
+import functools
+import os
 import re
 import shutil
+import sys
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date
+from itertools import islice
 from pathlib import Path
 from typing import Iterable
 
 from .model import Project, Status, Task, sort_tasks
-from .parse import parse_task
-from .scan import iter_task_files
+from .parse import ParseError, parse_task
+from .scan import TaskFile, iter_task_files
 
 
 # ---------------------------------------------------------------------
@@ -43,15 +48,23 @@ _COLOR = {
 }
 
 
+@functools.lru_cache(maxsize=1)
 def _supports_color() -> bool:
-    """Return True if stdout is a TTY."""
-    import sys
-
+    """Return True if stdout is a TTY (checked once per process)."""
     return sys.stdout.isatty()
 
 
+def _status_labels(use_color: bool) -> dict[Status, str]:
+    """Return display text per status, coloured if `use_color`."""
+    if not use_color:
+        return {s: s.value for s in Status}
+    return {s: f"{_COLOR.get(s, '')}{s.value}{_RESET}" for s in Status}
+
+
 def _visible_len(s: str) -> int:
     """Return string length without ANSI colour escapes."""
+    if "\x1b" not in s:
+        return len(s)
     return len(_ANSI_RE.sub("", s))
 
 
@@ -59,26 +72,29 @@ def _visible_len(s: str) -> int:
 # Task list helpers
 # ---------------------------------------------------------------------
 
-def _print_project_block(node: "ProjectNode", *, prefix: str, color: bool) -> None:
+def _render_project_block(
+    node: "ProjectNode",
+    out: list[str],
+    *,
+    prefix: str,
+    labels: dict[Status, str],
+    today: date,
+) -> None:
     """
-    Print tasks for a single project node.
+    Append task lines for a single project node to `out`.
+
+    `labels` maps each status to its (possibly coloured) display text.
 
     Tasks always come BEFORE subdirectories.
 
     Format:
       - Title (status: next action, Nd)
     """
-    today = date.today()
-
     sep = "=" * 6
-    print(f"{prefix}{sep}")
+    out.append(f"{prefix}{sep}")
 
-    for task in node.tasks:
-        status = task.status.value
-        status_col = status
-        if color and _supports_color():
-            c = _COLOR.get(task.status, "")
-            status_col = f"{c}{status}{_RESET}"
+    for task in sort_tasks(node.tasks):
+        status_col = labels[task.status]
 
         action = task.next_action.strip()
         if action:
@@ -90,9 +106,9 @@ def _print_project_block(node: "ProjectNode", *, prefix: str, color: bool) -> No
         age = f"{age_days}d"
 
         meta = f"{status_col}: {action}, {age}"
-        print(f"{prefix}- {task.title} ({meta}) id: {task.task_id}")
+        out.append(f"{prefix}- {task.title} ({meta}) id: {task.task_id}")
 
-    print(f"{prefix}{sep}")
+    out.append(f"{prefix}{sep}")
 
 
 # ---------------------------------------------------------------------
@@ -103,53 +119,67 @@ def render_task_detail(task: Task, *, color: bool = True) -> None:
     """
     Render a structured task detail view.
 
-    Width is capped at 80 characters (by design).
+    Width is capped at 80 characters (by design). Output is buffered and
+    written in one call.
     """
+    out: list[str] = []
+
     width = min(80, shutil.get_terminal_size(fallback=(80, 24)).columns)
     inner_w = max(20, width - 4)  # borders + padding
+    use_color = color and _supports_color()
+
+    status_color = _COLOR.get(task.status, "")
 
     def cdim(s: str) -> str:
-        return f"{_DIM}{s}{_RESET}" if color and _supports_color() else s
+        return f"{_DIM}{s}{_RESET}" if use_color else s
 
     def cstat(s: str) -> str:
-        if not (color and _supports_color()):
-            return s
-        c = _COLOR.get(task.status, "")
-        return f"{c}{s}{_RESET}"
+        return f"{status_color}{s}{_RESET}" if use_color else s
+
+    wrappers: dict[int, textwrap.TextWrapper] = {}
 
     def wrap_lines(s: str, *, indent: str = "") -> list[str]:
         if not s:
             return []
 
-        out: list[str] = []
+        w = inner_w - len(indent)
+        wrapper = wrappers.get(w)
+        if wrapper is None:
+            wrapper = textwrap.TextWrapper(
+                width=w,
+                break_long_words=False,
+                break_on_hyphens=False,
+            )
+            wrappers[w] = wrapper
+
+        lines: list[str] = []
         for ln in s.rstrip().splitlines() or [""]:
             if not ln.strip():
-                out.append(indent.rstrip())
+                lines.append(indent.rstrip())
                 continue
 
-            wrapped = textwrap.wrap(
-                ln,
-                width=inner_w - len(indent),
-                break_long_words=False,
-                break_on_hyphens=False,
-            ) or [""]
+            # Fits as-is (textwrap would only expand tabs / drop trailing space).
+            if len(ln) <= w and "\t" not in ln and not ln[-1].isspace():
+                lines.append(indent + ln)
+                continue
 
-            out.extend([indent + x for x in wrapped])
+            wrapped = wrapper.wrap(ln) or [""]
+            lines.extend([indent + x for x in wrapped])
 
-        return out
+        return lines
 
     def box_rule(ch: str = "-") -> None:
-        print(f"+{ch * (width - 2)}+")
+        out.append(f"+{ch * (width - 2)}+")
 
     def box_sep() -> None:
-        print(f"+{'-' * (width - 2)}+")
+        out.append(f"+{'-' * (width - 2)}+")
 
     def box_line(content: str = "") -> None:
         raw = content[:inner_w]
-        pad = inner_w - _visible_len(raw)
+        pad = inner_w - (_visible_len(raw) if use_color else len(raw))
         if pad > 0:
             raw = raw + (" " * pad)
-        print(f"| {raw} |")
+        out.append(f"| {raw} |")
 
     def box_title(left: str, right: str = "") -> None:
         if right:
@@ -168,11 +198,11 @@ def render_task_detail(task: Task, *, color: bool = True) -> None:
     created_s = task.created.isoformat()
     touch_s = task.last_touch.isoformat()
 
-    if color and _supports_color():
+    if use_color:
         created_s = cdim(created_s)
         touch_s = cstat(touch_s)
 
-    print()
+    out.append("")
     box_rule("=")
     box_title(title)
     box_rule("=")
@@ -212,7 +242,9 @@ def render_task_detail(task: Task, *, color: bool = True) -> None:
                 box_line(ln)
 
     box_rule("=")
-    print()
+    out.append("")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 # ---------------------------------------------------------------------
@@ -223,6 +255,8 @@ def render_task_detail(task: Task, *, color: bool = True) -> None:
 class ProjectNode:
     """
     A directory node used for rendering a project tree.
+
+    `tasks` is kept in scan order; it is sorted only when the node is rendered.
     """
 
     name: str
@@ -276,27 +310,42 @@ def attach_tasks(tree: ProjectNode) -> None:
     Load tasks for every project node in the tree.
 
     Non-fatal: parse errors are ignored in list mode.
+
+    Task files from all projects are parsed on a thread pool (the work is
+    mostly file reads and libyaml parsing).
     """
+    projects: list[tuple[ProjectNode, list[TaskFile]]] = []
 
-    def walk(node: ProjectNode) -> None:
+    # Depth-first, pre-order (explicit stack, no recursion).
+    stack = [tree]
+    while stack:
+        node = stack.pop()
         if node.is_project:
             tasks_dir = node.path / ".tasks"
             project = Project(root_dir=str(node.path), tasks_dir=str(tasks_dir))
+            projects.append((node, list(iter_task_files(project))))
 
-            tasks: list[Task] = []
-            for tf in iter_task_files(project):
-                try:
-                    task = parse_task(tf.task_dir, expected_task_id=tf.task_id)
-                except Exception:
-                    continue
-                tasks.append(task)
+        stack.extend(reversed(node.children.values()))
 
-            node.tasks = sort_tasks(tasks)
+    files = [tf for _, tfs in projects for tf in tfs]
+    if len(files) > 1:
+        workers = min(32, (os.cpu_count() or 1) * 4, len(files))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            parsed = list(ex.map(_parse_or_none, files))
+    else:
+        parsed = [_parse_or_none(tf) for tf in files]
 
-        for child in node.children.values():
-            walk(child)
+    results = iter(parsed)
+    for node, tfs in projects:
+        node.tasks = [t for t in islice(results, len(tfs)) if t is not None]
 
-    walk(tree)
+
+def _parse_or_none(tf: TaskFile) -> Task | None:
+    # ValueError covers Task.validate() invariants and undecodable task.log.
+    try:
+        return parse_task(tf.task_dir, expected_task_id=tf.task_id)
+    except (ParseError, ValueError):
+        return None
 
 
 # ---------------------------------------------------------------------
@@ -311,24 +360,50 @@ def render_tree(tree: ProjectNode, *, color: bool = True) -> None:
     - if it is a project: tasks first,
     - then subdirectories.
     """
-    print(tree.path)
+    labels = _status_labels(color and _supports_color())
+    today = date.today()
+    out: list[str] = [str(tree.path)]
 
     if tree.is_project and tree.tasks:
-        _print_project_block(tree, prefix="", color=color)
+        _render_project_block(tree, out, prefix="", labels=labels, today=today)
+
+    _render_children(tree, out, prefix="", labels=labels, today=today)
 
-    _render_children(tree, prefix="", color=color)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def _render_children(node: ProjectNode, *, prefix: str, color: bool) -> None:
-    items = sorted(node.children.values(), key=lambda n: n.name.lower())
-    for i, child in enumerate(items):
-        is_last = i == (len(items) - 1)
+def _render_children(
+    node: ProjectNode,
+    out: list[str],
+    *,
+    prefix: str,
+    labels: dict[Status, str],
+    today: date,
+) -> None:
+    # Depth-first with an explicit stack of (node, prefix, is_last).
+    stack: list[tuple[ProjectNode, str, bool]] = []
+
+    def push_children(parent: ProjectNode, parent_prefix: str) -> None:
+        items = sorted(parent.children.values(), key=lambda n: n.name.lower())
+        last = len(items) - 1
+        for i in range(last, -1, -1):
+            stack.append((items[i], parent_prefix, i == last))
+
+    push_children(node, prefix)
+    while stack:
+        child, cur_prefix, is_last = stack.pop()
         branch = "└── " if is_last else "├── "
-        next_prefix = prefix + ("    " if is_last else "│   ")
+        next_prefix = cur_prefix + ("    " if is_last else "│   ")
 
-        print(f"{prefix}{branch}{child.name}")
+        out.append(f"{cur_prefix}{branch}{child.name}")
 
         if child.is_project and child.tasks:
-            _print_project_block(child, prefix=next_prefix, color=color)
-
-        _render_children(child, prefix=next_prefix, color=color)
+            _render_project_block(
+                child,
+                out,
+                prefix=next_prefix,
+                labels=labels,
+                today=today,
+            )
+
+        push_children(child, next_prefix)
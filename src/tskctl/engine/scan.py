@@ -10,6 +10,7 @@ This module is responsible for discovering:
 It performs *no parsing* and *no rendering*.
 """
 
+import os
 from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
@@ -49,31 +50,44 @@ def iter_projects(root: str | Path, level: int) -> Iterator[Project]:
     if level < 0:
         return
 
-    root_path = Path(root)
+    top = str(Path(root))
 
-    def walk_dir(d: Path, depth: int) -> Iterator[Project]:
-        # Include current directory if it is a project.
-        tasks_dir = d / ".tasks"
-        if tasks_dir.is_dir():
-            yield Project(root_dir=str(d), tasks_dir=str(tasks_dir))
+    if level == 0:
+        tasks_dir = os.path.join(top, ".tasks")
+        if os.path.isdir(tasks_dir):
+            yield _project(top)
+        return
 
-        # Stop recursion if depth limit reached.
-        if depth >= level:
-            return
+    # os.walk skips unreadable directories silently (non-fatal by design).
+    depths = {top: 0}
+    for dirpath, dirnames, _ in os.walk(top):
+        depth = depths.pop(dirpath, 0)
+
+        if ".tasks" in dirnames:
+            dirnames.remove(".tasks")
+            yield _project(dirpath)
+
+        if depth + 1 < level:
+            for name in dirnames:
+                depths[os.path.join(dirpath, name)] = depth + 1
+            continue
+
+        # Children are at the depth limit: one stat each instead of a listing.
+        # Symlinked directories are skipped, as os.walk does when descending.
+        for name in dirnames:
+            child = os.path.join(dirpath, name)
+            if os.path.islink(child):
+                continue
+            tasks_dir = os.path.join(child, ".tasks")
+            if os.path.isdir(tasks_dir):
+                yield _project(child)
+        dirnames.clear()
 
-        # Recurse into child directories, skipping `.tasks`.
-        try:
-            for child in d.iterdir():
-                if not child.is_dir():
-                    continue
-                if child.name == ".tasks":
-                    continue
-                yield from walk_dir(child, depth + 1)
-        except PermissionError:
-            # Non-fatal: silently skip unreadable directories.
-            return
 
-    yield from walk_dir(root_path, 0)
+def _project(root_dir: str) -> Project:
+    # Normalise via Path so paths match the caller's form (e.g. "a", not "./a").
+    d = Path(root_dir)
+    return Project(root_dir=str(d), tasks_dir=str(d / ".tasks"))
 
 
 # ---------------------------------------------------------------------
@@ -93,27 +107,22 @@ def iter_task_files(project: Project) -> Iterator[TaskFile]:
               task.log
               summary.md      (optional)
     """
-    tasks_dir = Path(project.tasks_dir)
-    if not tasks_dir.is_dir():
-        return
-
     try:
-        for entry in tasks_dir.iterdir():
-            if not entry.is_dir():
-                continue
-
-            task_id = entry.name
-
-            task_yml = entry / "task.yml"
-            task_log = entry / "task.log"
-
-            # Both are required
-            if task_yml.is_file() and task_log.is_file():
-                yield TaskFile(
-                    project=project,
-                    task_id=task_id,
-                    task_dir=entry,
-                )
-    except PermissionError:
-        # Non-fatal: silently skip unreadable task directories.
+        with os.scandir(project.tasks_dir) as it:
+            # Symlinked task dirs count; others are answered from the listing.
+            entries = [e for e in it if e.is_dir()]
+    except OSError:
+        # Non-fatal: missing or unreadable task directories yield nothing.
         return
+
+    for entry in entries:
+        task_yml = os.path.join(entry.path, "task.yml")
+        task_log = os.path.join(entry.path, "task.log")
+
+        # Both are required
+        if os.path.isfile(task_yml) and os.path.isfile(task_log):
+            yield TaskFile(
+                project=project,
+                task_id=entry.name,
+                task_dir=Path(entry.path),
+            )
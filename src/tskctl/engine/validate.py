@@ -14,10 +14,11 @@ Responsibilities:
 It does NOT perform parsing or filesystem scanning.
 """
 
-import re
+import functools
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional, Sequence
+from typing import Final, Optional, Sequence
 
 from .model import Link, Status, Task
 
@@ -69,7 +70,15 @@ class ValidationResult:
 # Rules
 # ---------------------------------------------------------------------
 
-_LOG_LINE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}:\s+\[[a-z_]+\](?:\s+.+)?$")
+# Log lines follow `YYYY-MM-DD: [type] comment`, i.e. the grammar
+# ^\d{4}-\d{2}-\d{2}:\s+\[[a-z_]+\](?:\s+.+)?$ with Unicode \d and \s
+# (str.isdecimal / str.isspace); checked by hand below.
+_LOG_TYPE_CHARS = "abcdefghijklmnopqrstuvwxyz_"
+
+_ALLOWED_KINDS: Final[frozenset[str]] = frozenset(("file", "url", "note"))
+
+# Raw link kind -> normalized kind.
+_KIND_NORM: dict[Optional[str], str] = {}
 
 
 def validate_task_file(
@@ -90,7 +99,6 @@ def validate_task_file(
     - When `check_links` is True, file links are checked for existence.
       `project_root` is required for resolving relative file links.
     """
-    p = Path(task_dir)
     issues: list[ValidationIssue] = []
 
     # -----------------------------------------------------------------
@@ -123,7 +131,9 @@ def validate_task_file(
     # Log rules (strict, XHTML-like discipline)
     # -----------------------------------------------------------------
 
-    if not task.log_lines:
+    log_lines = task.log_lines
+
+    if not log_lines:
         issues.append(
             ValidationIssue(
                 code="log_empty",
@@ -131,12 +141,12 @@ def validate_task_file(
             )
         )
     else:
-        for i, line in enumerate(task.log_lines, start=1):
+        for i, line in enumerate(log_lines, start=1):
             s = line.strip()
             if not s:
                 continue
 
-            if not _LOG_LINE_RE.match(s):
+            if not _is_valid_log_line(s):
                 issues.append(
                     ValidationIssue(
                         code="log_bad_format",
@@ -145,8 +155,8 @@ def validate_task_file(
                 )
 
     # Done tasks must have an explicit closing marker.
-    if task.status is Status.DONE and task.log_lines:
-        if not _has_done_marker(task.log_lines):
+    if task.status is Status.DONE and log_lines:
+        if not _has_done_marker(log_lines):
             issues.append(
                 ValidationIssue(
                     code="done_no_marker",
@@ -161,55 +171,113 @@ def validate_task_file(
     # Links rules
     # -----------------------------------------------------------------
 
+    # One pass: basic invariants, plus containment/existence of file links
+    # when a project root is available.
+    root: Optional[str] = None
+    if check_links and project_root is not None:
+        root = _resolved_root(os.fspath(project_root))
+
     for i, link in enumerate(task.links, start=1):
-        _validate_link_basic(link, issues, i)
+        _validate_link(link, issues, i, root)
 
-    if check_links:
-        if project_root is None:
-            issues.append(
-                ValidationIssue(
-                    code="links_need_project_root",
-                    message=(
-                        "check_links requires project_root "
-                        "to resolve relative file links"
-                    ),
-                )
+    if check_links and project_root is None:
+        issues.append(
+            ValidationIssue(
+                code="links_need_project_root",
+                message=(
+                    "check_links requires project_root "
+                    "to resolve relative file links"
+                ),
             )
-        else:
-            _check_file_links_exist(task.links, Path(project_root), issues)
+        )
 
-    return ValidationResult(path=str(p), issues=tuple(issues))
+    return ValidationResult(path=os.fspath(task_dir), issues=tuple(issues))
 
 
 # ---------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------
 
-def _has_done_marker(log_lines: Iterable[str]) -> bool:
+def _is_valid_log_line(s: str) -> bool:
+    """
+    Return True if a stripped log line matches the log grammar.
+
+    Fixed-width date prefix and slicing instead of a regex: this runs for
+    every log line of every validated task.
+    """
+    if len(s) < 15 or s[4] != "-" or s[7] != "-" or s[10] != ":":
+        return False
+
+    digits = s[0:4] + s[5:7] + s[8:10]
+    if not digits.isdecimal():
+        return False
+
+    rest = s[11:].lstrip()
+    if len(rest) == len(s) - 11 or rest[:1] != "[":
+        return False
+
+    end = rest.find("]")
+    if end < 2 or rest[1:end].strip(_LOG_TYPE_CHARS):
+        return False
+
+    comment = rest[end + 1:]
+    if not comment:
+        return True
+
+    text = comment.lstrip()
+    return len(text) < len(comment) and bool(text) and "\n" not in text
+
+
+def _has_done_marker(log_lines: Sequence[str]) -> bool:
     """
     Return True if log contains a '[done]' marker (searching from the end).
     """
-    for line in reversed(list(log_lines)):
-        s = line.strip().lower()
-        if not s:
-            continue
-        if "[done]" in s:
+    # Closing entries sit at the end, so the reverse scan usually stops on
+    # the first line; blank lines can never contain the marker.
+    for line in reversed(log_lines):
+        if "[done]" in line.lower():
             return True
     return False
 
 
-def _validate_link_basic(
+def _norm_kind(kind: Optional[str]) -> str:
+    """
+    Return the stripped, lowercased link kind (memoized; kinds are few).
+    """
+    norm = _KIND_NORM.get(kind)
+    if norm is None:
+        norm = _KIND_NORM[kind] = (kind or "").strip().lower()
+    return norm
+
+
+@functools.lru_cache(maxsize=32)
+def _resolved_root(project_root: str) -> str:
+    """
+    Resolve a project root once; repository-wide validation checks many
+    tasks against the same few roots.
+
+    The result ends with a path separator so containment is a prefix test.
+    """
+    return os.path.join(os.path.realpath(project_root), "")
+
+
+def _validate_link(
     link: Link,
     issues: list[ValidationIssue],
     idx: int,
+    root: Optional[str],
 ) -> None:
     """
-    Validate basic link invariants without filesystem access.
+    Validate link invariants.
+
+    When `root` (see _resolved_root) is given, file links must also exist
+    and stay within it. Works on plain strings: one realpath per link
+    (symlinks must not escape the root either) and one stat.
     """
-    kind = (link.kind or "").strip().lower()
+    kind = _norm_kind(link.kind)
     value = (link.value or "").strip()
 
-    if kind not in {"file", "url", "note"}:
+    if kind not in _ALLOWED_KINDS:
         issues.append(
             ValidationIssue(
                 code="link_kind_invalid",
@@ -227,40 +295,26 @@ def _validate_link_basic(
                 message=f"Link {idx}: empty value",
             )
         )
+        return
 
+    if root is None or kind != "file":
+        return
 
-def _check_file_links_exist(
-    links: Sequence[Link],
-    project_root: Path,
-    issues: list[ValidationIssue],
-) -> None:
-    """
-    Check that file links exist and stay within project_root.
-    """
-    root = project_root.resolve()
-
-    for link in links:
-        if link.kind.strip().lower() != "file":
-            continue
-
-        rel = link.value.strip()
-        target = (root / rel).resolve()
+    target = os.path.realpath(os.path.join(root, value))
 
-        try:
-            target.relative_to(root)
-        except Exception:
-            issues.append(
-                ValidationIssue(
-                    code="link_file_outside_project",
-                    message=f"File link points outside project root: {rel}",
-                )
+    if not (target + os.sep).startswith(root):
+        issues.append(
+            ValidationIssue(
+                code="link_file_outside_project",
+                message=f"File link points outside project root: {value}",
             )
-            continue
+        )
+        return
 
-        if not target.exists():
-            issues.append(
-                ValidationIssue(
-                    code="link_file_missing",
-                    message=f"Missing linked file: {rel}",
-                )
+    if not os.path.exists(target):
+        issues.append(
+            ValidationIssue(
+                code="link_file_missing",
+                message=f"Missing linked file: {value}",
             )
+        )